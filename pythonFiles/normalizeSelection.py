@@ -7,6 +7,12 @@ import re
 import sys
 import textwrap
 
+_NEWLINES = re.compile(r"[\n\r]+")
+
+# A single line with no leading indent, comment or ';', i.e. a selection that
+# dedenting and statement splitting would leave untouched.
+_SINGLE_FLUSH_LEFT_LINE = re.compile(r"\A(?!\s)[^#;\n\r]*\Z")
+
 
 def split_lines(source):
     """
@@ -16,7 +22,7 @@ def split_lines(source):
     But splitlines() in Python 3 has a much larger list: for example, it also includes \v, \f.
     As such, this function will split lines across all Python versions.
     """
-    return re.split(r"[\n\r]+", source)
+    return _NEWLINES.split(source)
 
 
 def _get_statements(selection):
@@ -92,14 +98,20 @@ def normalize_lines(selection):
     and add newlines between each of them so the REPL knows where each block ends.
     """
     try:
-        # Parse the selection into a list of top-level blocks.
-        # We don't differentiate between single and multiline statements
-        # because it's not a perf bottleneck,
-        # and the overhead from splitting and rejoining strings in the multiline case is one-off.
-        statements = _get_statements(selection)
-
-        # Insert a newline between each top-level statement, and append a newline to the selection.
-        source = "\n".join(statements) + "\n"
+        if _SINGLE_FLUSH_LEFT_LINE.match(selection):
+            # A single flush-left statement has nothing to dedent, split or rejoin,
+            # we only need to make sure it parses before appending the newline.
+            ast.parse(selection)
+            source = selection + "\n"
+        else:
+            # Parse the selection into a list of top-level blocks.
+            # We don't differentiate between single and multiline statements
+            # because it's not a perf bottleneck,
+            # and the overhead from splitting and rejoining strings in the multiline case is one-off.
+            statements = _get_statements(selection)
+
+            # Insert a newline between each top-level statement, and append a newline to the selection.
+            source = "\n".join(statements) + "\n"
     except:
         # If there's a problem when parsing statements,
         # append a blank line to end the block and send it as-is.
@@ -8,115 +8,106 @@ import textwrap
 import normalizeForInterpreter
 
 
-class TestNormalizationScript(object):
-    """Basic unit tests for the normalization script."""
+# Test inputs are dedented once at import rather than inside each test.
+MORE_THAN_ONE_LINE_SRC = textwrap.dedent(
+    """\
+    # Some rando comment
 
-    @pytest.mark.skipif(
-        sys.version_info.major == 2,
-        reason="normalizeForInterpreter not working for 2.7, see GH #4805",
-    )
-    def test_basicNormalization(self, capsys):
-        src = 'print("this is a test")'
-        normalizeForInterpreter.normalize_lines(src)
-        captured = capsys.readouterr()
-        assert captured.out == src
+    def show_something():
+        print("Something")
+    """
+)
 
-    @pytest.mark.skipif(
-        sys.version_info.major == 2,
-        reason="normalizeForInterpreter not working for 2.7, see GH #4805",
-    )
-    def test_moreThanOneLine(self, capsys):
-        src = textwrap.dedent(
-            """\
-            # Some rando comment
-
-            def show_something():
-                print("Something")
-            """
-        )
-        normalizeForInterpreter.normalize_lines(src)
-        captured = capsys.readouterr()
-        assert captured.out == src
+HANGING_INDENT_SRC = textwrap.dedent(
+    """\
+    x = 22
+    y = 30
+    z = -10
+    result = x + y + z
 
-    @pytest.mark.skipif(
-        sys.version_info.major == 2,
-        reason="normalizeForInterpreter not working for 2.7, see GH #4805",
-    )
-    def test_withHangingIndent(self, capsys):
-        src = textwrap.dedent(
-            """\
-            x = 22
-            y = 30
-            z = -10
-            result = x + y + z
-
-            if result == 42:
-                print("The answer to life, the universe, and everything")
-            """
-        )
-        normalizeForInterpreter.normalize_lines(src)
-        captured = capsys.readouterr()
-        assert captured.out == src
+    if result == 42:
+        print("The answer to life, the universe, and everything")
+    """
+)
 
-    @pytest.mark.skipif(
-        sys.version_info.major == 2,
-        reason="normalizeForInterpreter not working for 2.7, see GH #4805",
-    )
-    def test_clearOutExtraneousNewlines(self, capsys):
-        src = textwrap.dedent(
-            """\
-            value_x = 22
+EXTRANEOUS_NEWLINES_SRC = textwrap.dedent(
+    """\
+    value_x = 22
 
-            value_y = 30
+    value_y = 30
 
-            value_z = -10
+    value_z = -10
 
-            print(value_x + value_y + value_z)
+    print(value_x + value_y + value_z)
 
-            """
-        )
-        expectedResult = textwrap.dedent(
-            """\
-            value_x = 22
-            value_y = 30
-            value_z = -10
-            print(value_x + value_y + value_z)
+    """
+)
 
-            """
-        )
-        normalizeForInterpreter.normalize_lines(src)
-        result = capsys.readouterr()
-        assert result.out == expectedResult
+EXTRANEOUS_NEWLINES_EXPECTED = textwrap.dedent(
+    """\
+    value_x = 22
+    value_y = 30
+    value_z = -10
+    print(value_x + value_y + value_z)
 
-    @pytest.mark.skipif(
-        sys.version_info.major == 2,
-        reason="normalizeForInterpreter not working for 2.7, see GH #4805",
-    )
-    def test_clearOutExtraLinesAndWhitespace(self, capsys):
-        src = textwrap.dedent(
-            """\
-            if True:
-                x = 22
+    """
+)
+
+EXTRA_LINES_AND_WHITESPACE_SRC = textwrap.dedent(
+    """\
+    if True:
+        x = 22
+
+        y = 30
+
+        z = -10
+
+    print(x + y + z)
 
-                y = 30
+    """
+)
 
-                z = -10
+EXTRA_LINES_AND_WHITESPACE_EXPECTED = textwrap.dedent(
+    """\
+    if True:
+        x = 22
+        y = 30
+        z = -10
 
-            print(x + y + z)
+    print(x + y + z)
 
-            """
-        )
-        expectedResult = textwrap.dedent(
-            """\
-            if True:
-                x = 22
-                y = 30
-                z = -10
+    """
+)
 
-            print(x + y + z)
 
-            """
-        )
+BASIC_SRC = 'print("this is a test")'
+
+NORMALIZATION_CASES = [
+    pytest.param(BASIC_SRC, BASIC_SRC, id="basicNormalization"),
+    pytest.param(MORE_THAN_ONE_LINE_SRC, MORE_THAN_ONE_LINE_SRC, id="moreThanOneLine"),
+    pytest.param(HANGING_INDENT_SRC, HANGING_INDENT_SRC, id="withHangingIndent"),
+    pytest.param(
+        EXTRANEOUS_NEWLINES_SRC,
+        EXTRANEOUS_NEWLINES_EXPECTED,
+        id="clearOutExtraneousNewlines",
+    ),
+    pytest.param(
+        EXTRA_LINES_AND_WHITESPACE_SRC,
+        EXTRA_LINES_AND_WHITESPACE_EXPECTED,
+        id="clearOutExtraLinesAndWhitespace",
+    ),
+]
+
+
+class TestNormalizationScript(object):
+    """Basic unit tests for the normalization script."""
+
+    @pytest.mark.skipif(
+        sys.version_info.major == 2,
+        reason="normalizeForInterpreter not working for 2.7, see GH #4805",
+    )
+    @pytest.mark.parametrize("src, expectedResult", NORMALIZATION_CASES)
+    def test_normalization(self, capsys, src, expectedResult):
         normalizeForInterpreter.normalize_lines(src)
         result = capsys.readouterr()
         assert result.out == expectedResult
@@ -0,0 +1,30 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import re
+
+import pytest
+
+import normalizeSelection
+
+SINGLE_LINE_CASES = [
+    pytest.param('print("this is a test")', id="plainStatement"),
+    pytest.param("if True:", id="incompleteBlock"),
+    pytest.param("", id="empty"),
+    pytest.param("x = 22  # a comment", id="trailingComment"),
+    pytest.param("    x = 22", id="leadingWhitespace"),
+    pytest.param("x = 22; y = 30", id="semicolon"),
+]
+
+
+class TestNormalizeLines(object):
+    """Unit tests for the single line shortcut in normalizeSelection.normalize_lines."""
+
+    @pytest.mark.parametrize("src", SINGLE_LINE_CASES)
+    def test_single_line_shortcut(self, monkeypatch, src):
+        shortcut = normalizeSelection.normalize_lines(src)
+        # A pattern that never matches sends every selection down the full parse and split path
+        monkeypatch.setattr(
+            normalizeSelection, "_SINGLE_FLUSH_LEFT_LINE", re.compile(r"(?!)")
+        )
+        assert shortcut == normalizeSelection.normalize_lines(src)
@@ -4,53 +4,81 @@ import json as _VSCODE_json
 import numpy as _VSCODE_np
 import pandas.io.json as _VSCODE_pd_json
 
-# PyTorch and TensorFlow tensors which can be converted to numpy arrays
-_VSCODE_allowedTensorTypes = ["Tensor", "EagerTensor"]
+try:
+    import orjson as _VSCODE_orjson
+except ImportError:
+    _VSCODE_orjson = None
+
+# Compact output like orjson's, the extension only ever JSON.parses the result
+_VSCODE_jsonEncoder = _VSCODE_json.JSONEncoder(
+    separators=(",", ":"), ensure_ascii=False
+)
+
+
+# Function that dumps our results to a json string, preferring orjson when the kernel has it
+def _VSCODE_dumps(obj):
+    if _VSCODE_orjson is not None:
+        try:
+            return _VSCODE_orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            # orjson rejects some values json accepts (e.g. non string keys)
+            pass
+    return _VSCODE_jsonEncoder.encode(obj)
 
 
 def _VSCODE_stringifyElement(element):
-    if isinstance(element, _VSCODE_np.ndarray):
+    elementType = _VSCODE_builtins.type(element)
+    if (
+        elementType is _VSCODE_builtins.str
+        or elementType is _VSCODE_builtins.int
+        or elementType is _VSCODE_builtins.float
+    ):
+        # Plain scalars are the common case and are returned as is
+        return element
+    if _VSCODE_builtins.isinstance(element, _VSCODE_np.ndarray):
         # Ensure no rjust or ljust padding is applied to stringified elements
         stringified = _VSCODE_np.array2string(
-            element, separator=", ", formatter={"all": lambda x: str(x)}
+            element,
+            separator=", ",
+            formatter={"all": lambda x: _VSCODE_builtins.str(x)},
         )
-    elif isinstance(element, (list, tuple)):
+    elif _VSCODE_builtins.isinstance(
+        element, (_VSCODE_builtins.list, _VSCODE_builtins.tuple)
+    ):
         # We can't pass lists and tuples to array2string because it expects
         # the size attribute to be defined
-        stringified = str(element)
+        stringified = _VSCODE_builtins.str(element)
     else:
         stringified = element
     return stringified
 
 
+# Element-wise _VSCODE_stringifyElement over object arrays, with the loop running in C
+_VSCODE_stringifyElements = _VSCODE_np.frompyfunc(_VSCODE_stringifyElement, 1, 1)
+
+
 def _VSCODE_convertNumpyArrayToDataFrame(ndarray, start=None, end=None):
-    # Save the user's current setting
-    current_options = _VSCODE_np.get_printoptions()
-    # Ask for the full string. Without this numpy truncates to 3 leading and 3 trailing by default
-    _VSCODE_np.set_printoptions(threshold=99999)
+    if start is not None and end is not None:
+        ndarray = ndarray[start:end]
+    if ndarray.ndim < 3 and ndarray.dtype.kind != "O":
+        # Nothing to stringify, so skip the printoptions round trip and share the array's buffer
+        return _VSCODE_pd.DataFrame(ndarray, copy=False)
 
-    flattened = None
-    try:
-        if start is not None and end is not None:
-            ndarray = ndarray[start:end]
-        if ndarray.ndim < 3 and str(ndarray.dtype) != "object":
-            pass
-        elif ndarray.ndim == 1 and str(ndarray.dtype) == "object":
-            flattened = _VSCODE_np.empty(ndarray.shape[:2], dtype="object")
-            for i in range(len(flattened)):
-                flattened[i] = _VSCODE_stringifyElement(ndarray[i])
-            ndarray = flattened
+    # Ask for the full string. Without this numpy truncates to 3 leading and 3 trailing by default.
+    # The context manager restores the user's printoptions (and is thread safe in newer numpy)
+    with _VSCODE_np.printoptions(threshold=99999):
+        if ndarray.ndim < 3:
+            ndarray = _VSCODE_stringifyElements(ndarray)
         else:
-            flattened = _VSCODE_np.empty(ndarray.shape[:2], dtype="object")
-            for i in range(len(flattened)):
-                for j in range(len(flattened[i])):
-                    flattened[i][j] = _VSCODE_stringifyElement(ndarray[i][j])
-            ndarray = flattened
-    finally:
-        # Restore the user's printoptions
-        _VSCODE_np.set_printoptions(threshold=current_options["threshold"])
-        del flattened
-        return _VSCODE_pd.DataFrame(ndarray)
+            # Each cell of the first two dimensions is itself an array, stringify them in one pass
+            rows, columns = ndarray.shape[:2]
+            cells = ndarray.reshape((rows * columns,) + ndarray.shape[2:])
+            flattened = _VSCODE_np.empty(rows * columns, dtype="object")
+            flattened[:] = _VSCODE_builtins.list(
+                _VSCODE_builtins.map(_VSCODE_stringifyElement, cells)
+            )
+            ndarray = flattened.reshape(rows, columns)
+    return _VSCODE_pd.DataFrame(ndarray)
 
 
 # Function that converts tensors to DataFrames
@@ -67,16 +95,22 @@ def _VSCODE_convertTensorToDataFrame(tensor, start=None, end=None):
             # This guard is needed because to_dense exists on all PyTorch
             # tensors and throws an error if the tensor is already strided
             temp = temp.to_dense()
+        # Two step conversion process required to convert tensors to DataFrames
+        # tensor --> numpy array --> dataframe
         # See https://discuss.pytorch.org/t/should-it-really-be-necessary-to-do-var-detach-cpu-numpy/35489
-        if hasattr(temp, "data"):
+        if hasattr(temp, "detach"):
             # PyTorch tensors need to be explicitly detached
             # from the computation graph and copied to CPU
-            temp = temp.data.detach().cpu()
-        # Two step conversion process required to convert tensors to DataFrames
-        # tensor --> numpy array --> dataframe
-        temp = temp.numpy()
+            try:
+                # force=True does both in one call and shares memory with CPU tensors
+                temp = temp.detach().numpy(force=True)
+            except TypeError:
+                # PyTorch < 1.13 doesn't support the force argument
+                temp = temp.detach().cpu().numpy()
+        else:
+            temp = temp.numpy()
         if temp.ndim == 0:
-            temp = [temp]
+            temp = temp.reshape(1)
         temp = _VSCODE_convertNumpyArrayToDataFrame(temp)
         tensor = temp
         del temp
@@ -87,56 +121,141 @@ def _VSCODE_convertTensorToDataFrame(tensor, start=None, end=None):
     return tensor
 
 
-# Function that converts the var passed in into a pandas data frame if possible
-def _VSCODE_convertToDataFrame(df, start=None, end=None):
-    vartype = type(df)
-    if isinstance(df, list):
-        df = _VSCODE_pd.DataFrame(df).iloc[start:end]
-    elif isinstance(df, _VSCODE_pd.Series):
-        df = _VSCODE_pd.Series.to_frame(df).iloc[start:end]
-    elif isinstance(df, dict):
-        df = _VSCODE_pd.Series(df)
-        df = _VSCODE_pd.Series.to_frame(df).iloc[start:end]
-    elif hasattr(df, "toPandas"):
-        df = df.toPandas().iloc[start:end]
-    elif (
-        hasattr(vartype, "__name__") and vartype.__name__ in _VSCODE_allowedTensorTypes
-    ):
-        df = _VSCODE_convertTensorToDataFrame(df, start, end)
-    elif hasattr(vartype, "__name__") and vartype.__name__ == "ndarray":
-        df = _VSCODE_convertNumpyArrayToDataFrame(df, start, end)
-    elif (
-        hasattr(df, "__array__")
-        and hasattr(vartype, "__name__")
-        and vartype.__name__ == "DataArray"
+# Function that converts an xarray DataArray to a DataFrame via its numpy array
+def _VSCODE_convertDataArrayToDataFrame(dataArray, start=None, end=None):
+    if not hasattr(dataArray, "__array__"):
+        return _VSCODE_convertAnyToDataFrame(dataArray, start, end)
+    # Slice the DataArray itself so only the requested rows get materialized,
+    # the resulting array must not be sliced a second time
+    return _VSCODE_convertNumpyArrayToDataFrame(dataArray[start:end].__array__())
+
+
+# Function that tries to have pandas convert anything else
+def _VSCODE_convertAnyToDataFrame(df, start=None, end=None):
+    """Disabling bandit warning for try, except, pass. We want to swallow all exceptions here to not crash on
+    variable fetching"""
+    try:
+        temp = _VSCODE_pd.DataFrame(df).iloc[start:end]
+        df = temp
+    except:  # nosec
+        pass
+    return df
+
+
+# Converters keyed by type name, for array types we can't import here.
+# PyTorch and TensorFlow tensors can be converted to numpy arrays
+_VSCODE_arrayConverters = {
+    "Tensor": _VSCODE_convertTensorToDataFrame,
+    "EagerTensor": _VSCODE_convertTensorToDataFrame,
+    "ndarray": _VSCODE_convertNumpyArrayToDataFrame,
+    "DataArray": _VSCODE_convertDataArrayToDataFrame,
+}
+
+
+def _VSCODE_convertListToDataFrame(df, start=None, end=None):
+    return _VSCODE_pd.DataFrame(df).iloc[start:end]
+
+
+def _VSCODE_convertSeriesToDataFrame(df, start=None, end=None):
+    return _VSCODE_pd.Series.to_frame(df).iloc[start:end]
+
+
+def _VSCODE_convertDictToDataFrame(df, start=None, end=None):
+    values = _VSCODE_builtins.list(df.values())
+    if values and _VSCODE_builtins.all(
+        _VSCODE_builtins.isinstance(
+            value,
+            (
+                _VSCODE_builtins.list,
+                _VSCODE_builtins.tuple,
+                _VSCODE_np.ndarray,
+                _VSCODE_pd.Series,
+            ),
+        )
+        for value in values
     ):
-        df = _VSCODE_convertNumpyArrayToDataFrame(df[start:end].__array__(), start, end)
-    else:
-        """Disabling bandit warning for try, except, pass. We want to swallow all exceptions here to not crash on
-        variable fetching"""
         try:
-            temp = _VSCODE_pd.DataFrame(df).iloc[start:end]
-            df = temp
-        except:  # nosec
-            pass
-    del vartype
-    return df
+            lengths = {_VSCODE_builtins.len(value) for value in values}
+        except TypeError:
+            # 0-d arrays have no len
+            lengths = None
+        # Tuple keys would become MultiIndex columns, which to_json(orient="table") can't write
+        if (
+            lengths
+            and _VSCODE_builtins.len(lengths) == 1
+            and not _VSCODE_builtins.any(
+                _VSCODE_builtins.isinstance(key, _VSCODE_builtins.tuple) for key in df
+            )
+        ):
+            try:
+                # A dict of equal length arrays is a table with a column per key
+                frame = _VSCODE_pd.DataFrame(df)
+                # Series are aligned on their index, don't show rows that alignment made up
+                if _VSCODE_builtins.len(frame.index) in lengths:
+                    return frame.iloc[start:end]
+            except ValueError:
+                # Dimensions don't line up, fall through to the single column view
+                pass
+    # Otherwise show the dict as a single column
+    df = _VSCODE_pd.Series(df)
+    return _VSCODE_pd.Series.to_frame(df).iloc[start:end]
+
+
+# Function that converts Spark and other toPandas() capable data frames
+def _VSCODE_convertPandasConvertibleToDataFrame(df, start=None, end=None):
+    return df.toPandas().iloc[start:end]
+
+
+# Function that picks the converter for values of the given type
+def _VSCODE_getConverter(vartype):
+    if _VSCODE_builtins.issubclass(vartype, _VSCODE_builtins.list):
+        return _VSCODE_convertListToDataFrame
+    if _VSCODE_builtins.issubclass(vartype, _VSCODE_pd.Series):
+        return _VSCODE_convertSeriesToDataFrame
+    if _VSCODE_builtins.issubclass(vartype, _VSCODE_builtins.dict):
+        return _VSCODE_convertDictToDataFrame
+    if _VSCODE_builtins.hasattr(vartype, "toPandas"):
+        return _VSCODE_convertPandasConvertibleToDataFrame
+    return _VSCODE_arrayConverters.get(
+        _VSCODE_builtins.getattr(vartype, "__name__", None),
+        _VSCODE_convertAnyToDataFrame,
+    )
+
+
+# Converters already picked for a type, the data viewer asks for the same variable over and over while scrolling
+_VSCODE_convertersByType = {}
+
+
+# Function that converts the var passed in into a pandas data frame if possible
+def _VSCODE_convertToDataFrame(df, start=None, end=None):
+    vartype = _VSCODE_builtins.type(df)
+    converter = _VSCODE_convertersByType.get(vartype)
+    if converter is None:
+        converter = _VSCODE_getConverter(vartype)
+        # Keep the cache bounded, types created on the fly (e.g. in a loop) would otherwise pile up
+        if _VSCODE_builtins.len(_VSCODE_convertersByType) >= 64:
+            _VSCODE_convertersByType.clear()
+        _VSCODE_convertersByType[vartype] = converter
+    return converter(df, start, end)
 
 
 # Function to compute row count for a value
 def _VSCODE_getRowCount(var):
-    if hasattr(var, "shape"):
-        try:
-            # Get a bit more restrictive with exactly what we want to count as a shape, since anything can define it
-            if isinstance(var.shape, tuple):
-                return var.shape[0]
-        except TypeError:
-            return 0
-    elif hasattr(var, "__len__"):
-        try:
-            return _VSCODE_builtins.len(var)
-        except TypeError:
-            return 0
+    if _VSCODE_builtins.isinstance(var, _VSCODE_pd.DataFrame):
+        # Data frames are what we get most of the time, len of the index avoids building the shape tuple
+        return _VSCODE_builtins.len(var.index)
+    try:
+        shape = var.shape
+    except AttributeError:
+        if hasattr(var, "__len__"):
+            try:
+                return _VSCODE_builtins.len(var)
+            except TypeError:
+                return 0
+        return None
+    # Get a bit more restrictive with exactly what we want to count as a shape, since anything can define it
+    if isinstance(shape, tuple):
+        return shape[0]
 
 
 # Function to retrieve a set of rows for a data frame
@@ -166,9 +285,19 @@ def _VSCODE_getDataFrameInfo(df):
     # we ask for all of the rows
     if rowCount:
         try:
-            row = df.iloc[0:1]
-            json_row = _VSCODE_pd_json.to_json(None, row, date_format="iso")
-            columnNames = list(_VSCODE_json.loads(json_row))
+            columnNames = _VSCODE_builtins.list(df.columns)
+            if df.columns.is_unique and _VSCODE_builtins.all(
+                _VSCODE_builtins.isinstance(
+                    name, (_VSCODE_builtins.str, _VSCODE_builtins.int)
+                )
+                for name in columnNames
+            ):
+                # pandas names string and integer columns str(name) in its json, no need for the round trip
+                columnNames = [_VSCODE_builtins.str(name) for name in columnNames]
+            else:
+                row = df.iloc[0:1]
+                json_row = _VSCODE_pd_json.to_json(None, row, date_format="iso")
+                columnNames = list(_VSCODE_json.loads(json_row))
         except:
             columnNames = list(df)
     else:
@@ -184,19 +313,20 @@ def _VSCODE_getDataFrameInfo(df):
 
     # Make sure the index column exists
     if indexColumn not in columnNames:
-        columnNames.insert(0, indexColumn)
-        columnTypes.insert(0, "int64")
+        columnNames = [indexColumn] + columnNames
+        columnTypes = ["int64"] + columnTypes
 
     # Then loop and generate our output json
     columns = []
-    for n in _VSCODE_builtins.range(0, _VSCODE_builtins.len(columnNames)):
-        column_type = columnTypes[n]
-        column_name = str(columnNames[n])
-        colobj = {}
-        colobj["key"] = column_name
-        colobj["name"] = column_name
-        colobj["type"] = str(column_type)
-        columns.append(colobj)
+    for column_name, column_type in _VSCODE_builtins.zip(columnNames, columnTypes):
+        column_name = _VSCODE_builtins.str(column_name)
+        columns.append(
+            {
+                "key": column_name,
+                "name": column_name,
+                "type": _VSCODE_builtins.str(column_type),
+            }
+        )
 
     # Save this in our target
     target = {}
@@ -205,4 +335,4 @@ def _VSCODE_getDataFrameInfo(df):
     target["rowCount"] = rowCount
 
     # return our json object as a string
-    return _VSCODE_json.dumps(target)
+    return _VSCODE_dumps(target)
@@ -2,6 +2,28 @@
 import json as _VSCODE_json
 import builtins as _VSCODE_builtins
 
+try:
+    import orjson as _VSCODE_orjson
+except ImportError:
+    _VSCODE_orjson = None
+
+# Compact output like orjson's, the extension only ever JSON.parses the result
+_VSCODE_jsonEncoder = _VSCODE_json.JSONEncoder(
+    separators=(",", ":"), ensure_ascii=False
+)
+
+
+# Function that dumps our results to a json string, preferring orjson when the kernel has it
+def _VSCODE_dumps(obj):
+    if _VSCODE_orjson is not None:
+        try:
+            return _VSCODE_orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            # orjson rejects some values json accepts (e.g. non string keys)
+            pass
+    return _VSCODE_jsonEncoder.encode(obj)
+
+
 # Function to do our work. It will return the object
 def _VSCODE_getVariableInfo(var):
     # Start out without the information
@@ -10,24 +32,30 @@ def _VSCODE_getVariableInfo(var):
     result["count"] = 0
     result["type"] = ""
 
-    typeName = None
-    try:
-        vartype = type(var)
-        if hasattr(vartype, "__name__"):
-            result["type"] = typeName = vartype.__name__
-    except TypeError:
-        pass
+    typeName = _VSCODE_builtins.getattr(_VSCODE_builtins.type(var), "__name__", None)
+    if typeName is not None:
+        result["type"] = typeName
 
-    # Find shape and count if available
-    if hasattr(var, "shape"):
+    # Find shape and count if available. getattr with a default looks the attribute up once,
+    # where hasattr followed by the access looks it up twice
+    shape = _VSCODE_builtins.getattr(var, "shape", None)
+    if shape is not None:
         try:
-            # Get a bit more restrictive with exactly what we want to count as a shape, since anything can define it
             if (
-                isinstance(var.shape, tuple)
+                _VSCODE_builtins.isinstance(shape, _VSCODE_builtins.tuple)
+                and _VSCODE_builtins.type(shape).__name__ == "Size"
+            ):
+                # torch.Size is a tuple, format its dimensions rather than parsing "torch.Size([...])"
+                result["shape"] = (
+                    "(" + ", ".join(_VSCODE_builtins.str(dim) for dim in shape) + ")"
+                )
+            # Get a bit more restrictive with exactly what we want to count as a shape, since anything can define it
+            elif (
+                isinstance(shape, tuple)
                 or typeName is not None
                 and typeName == "EagerTensor"
             ):
-                _VSCODE_shapeStr = str(var.shape)
+                _VSCODE_shapeStr = str(shape)
                 if (
                     len(_VSCODE_shapeStr) >= 3
                     and _VSCODE_shapeStr[0] == "("
@@ -35,8 +63,6 @@ def _VSCODE_getVariableInfo(var):
                     and "," in _VSCODE_shapeStr
                 ):
                     result["shape"] = _VSCODE_shapeStr
-                elif _VSCODE_shapeStr.startswith("torch.Size(["):
-                    result["shape"] = "(" + _VSCODE_shapeStr[12:-2] + ")"
                 del _VSCODE_shapeStr
         except TypeError:
             pass
@@ -48,7 +74,7 @@ def _VSCODE_getVariableInfo(var):
             pass
 
     # return our json object as a string
-    return _VSCODE_json.dumps(result)
+    return _VSCODE_dumps(result)
 
 
 def _VSCODE_getVariableProperties(var, listOfAttributes):
@@ -57,17 +83,18 @@ def _VSCODE_getVariableProperties(var, listOfAttributes):
         for attr in listOfAttributes
         if hasattr(var, attr)
     }
-    return _VSCODE_json.dumps(result)
+    return _VSCODE_dumps(result)
 
 
 def _VSCODE_getVariableTypes(varnames):
     # Map with key: varname and value: vartype
+    variables = _VSCODE_builtins.globals()
     result = {}
     for name in varnames:
-        try:
-            vartype = type(globals()[name])
-            if hasattr(vartype, "__name__"):
-                result[name] = vartype.__name__
-        except TypeError:
-            pass
-    return _VSCODE_json.dumps(result)
+        if name in variables:
+            typeName = _VSCODE_builtins.getattr(
+                _VSCODE_builtins.type(variables[name]), "__name__", None
+            )
+            if typeName is not None:
+                result[name] = typeName
+    return _VSCODE_dumps(result)
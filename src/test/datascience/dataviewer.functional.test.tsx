@@ -316,6 +316,46 @@ suite('DataScience DataViewer tests', () => {
         verifyRows(wrapper.wrapper, [0, 0, 1, 1, 2, 2, 3, 3]);
     });
 
+    runMountedTest('Dict of equal length lists', async (wrapper) => {
+        await injectCode("d = {'a': [0, 1], 'b': [2, 3]}");
+        const gotAllRows = getCompletedPromise(wrapper);
+        const dv = await createJupyterVariableDataViewer('d', 'dict');
+        assert.ok(dv, 'DataViewer not created');
+        await gotAllRows;
+
+        verifyRows(wrapper.wrapper, [0, 0, 2, 1, 1, 3]);
+    });
+
+    runMountedTest('Dict of mismatched length lists', async (wrapper) => {
+        await injectCode("d = {'a': [0, 1], 'b': [2]}");
+        const gotAllRows = getCompletedPromise(wrapper);
+        const dv = await createJupyterVariableDataViewer('d', 'dict');
+        assert.ok(dv, 'DataViewer not created');
+        await gotAllRows;
+
+        verifyRows(wrapper.wrapper, [0, '0,1', 1, '2']);
+    });
+
+    runMountedTest('Dict with tuple keys', async (wrapper) => {
+        await injectCode("d = {('a', 'b'): [1, 2], ('c', 'd'): [3, 4]}");
+        const gotAllRows = getCompletedPromise(wrapper);
+        const dv = await createJupyterVariableDataViewer('d', 'dict');
+        assert.ok(dv, 'DataViewer not created');
+        await gotAllRows;
+
+        verifyRows(wrapper.wrapper, [0, '1,2', 1, '3,4']);
+    });
+
+    runMountedTest('Dict of mismatched length Series', async (wrapper) => {
+        await injectCode("import pandas as pd\r\nd = {'a': pd.Series([1, 2]), 'b': pd.Series([1, 2, 3])}");
+        const gotAllRows = getCompletedPromise(wrapper);
+        const dv = await createJupyterVariableDataViewer('d', 'dict');
+        assert.ok(dv, 'DataViewer not created');
+        await gotAllRows;
+
+        verifyRows(wrapper.wrapper, [0, '1,2', 1, '1,2,3']);
+    });
+
     runMountedTest('Series', async (wrapper) => {
         await injectCode('import pandas as pd\r\ns = pd.Series([0, 1, 2, 3])');
         const gotAllRows = getCompletedPromise(wrapper);
@@ -547,6 +587,24 @@ suite('DataScience DataViewer tests', () => {
         verifyRows(wrapper.wrapper, [0, 1, 2, 3, 1, 4, 5, 6]);
     });
 
+    runMountedTest('Fetch xarray DataArray rows from an offset', async (_wrapper) => {
+        await injectCode(
+            'import xarray as xr\r\nfoo = xr.DataArray([[1,2,3],[4,5,6],[7,8,9]], dims=list("ab"), coords=dict(a=["x","y","z"], b=["m","n","o"]))'
+        );
+        const dataProvider = await createJupyterVariableDataProvider(createJupyterVariable('foo', 'DataArray', ''));
+        const rows = await dataProvider.getRows(1, 3);
+
+        assert.equal(rows.length, 2, 'Wrong number of rows returned');
+        assert.deepEqual(
+            rows.map((row: any) => [row['0'], row['1'], row['2']]),
+            [
+                [4, 5, 6],
+                [7, 8, 9]
+            ],
+            'Rows 1 to 3 not returned'
+        );
+    });
+
     runMountedTest('Ragged 1D numpy array', async (wrapper) => {
         await injectCode("import numpy as np\r\nfoo = np.array(['hello', 42, ['hi', 'hey']])");
         const gotAllRows = getCompletedPromise(wrapper);
@@ -1,15 +1,17 @@
 // Copyright (c) Microsoft Corporation. All rights reserved.
 // Licensed under the MIT License.
 'use strict';
+import { nbformat } from '@jupyterlab/coreutils';
 import { expect } from 'chai';
 import { ReactWrapper } from 'enzyme';
 import { parse } from 'node-html-parser';
 import * as React from 'react';
+import * as uuid from 'uuid/v4';
 
 import { Uri } from 'vscode';
 import { IDocumentManager } from '../../client/common/application/types';
 import { createDeferred } from '../../client/common/utils/async';
-import { Identifiers } from '../../client/datascience/constants';
+import { GetVariableInfo, Identifiers } from '../../client/datascience/constants';
 import { getDefaultInteractiveIdentity } from '../../client/datascience/interactive-window/identity';
 import {
     IJupyterDebugService,
@@ -17,6 +19,7 @@ import {
     IJupyterVariables,
     INotebookProvider
 } from '../../client/datascience/types';
+import { concatMultilineString } from '../../datascience-ui/common';
 import { DataScienceIocContainer } from './dataScienceIocContainer';
 import { getOrCreateInteractiveWindow } from './interactiveWindowTestHelpers';
 import { MockDocumentManager } from './mockDocumentManager';
@@ -166,3 +169,30 @@ export async function verifyCanFetchData<T>(
         expect(val).to.be.eq(rows[i], 'Invalid value found');
     }
 }
+
+export async function verifyVariableTypes(
+    ioc: DataScienceIocContainer,
+    names: string[],
+    types: { [name: string]: string }
+) {
+    const notebookProvider = ioc.get<INotebookProvider>(INotebookProvider);
+    const notebook = await notebookProvider.getOrCreateNotebook({
+        getOnly: true,
+        identity: getDefaultInteractiveIdentity(),
+        resource: undefined
+    });
+    expect(notebook).to.not.be.undefined;
+    // The variable explorer has already imported the variable info scripts into the kernel
+    const cells = await notebook!.execute(
+        `print(${GetVariableInfo.VariableTypesFunc}(${JSON.stringify(names)}))`,
+        Identifiers.EmptyFileName,
+        0,
+        uuid(),
+        undefined,
+        true
+    );
+    expect(cells).to.have.length(1, 'Wrong number of cells returned');
+    const output = (cells[0].data as nbformat.ICodeCell).outputs[0];
+    expect(output.evalue).to.be.undefined;
+    expect(JSON.parse(concatMultilineString(output.text as any))).to.deep.eq(types, 'Wrong variable types');
+}
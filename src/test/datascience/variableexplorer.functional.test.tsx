@@ -12,7 +12,7 @@ import { DataScienceIocContainer } from './dataScienceIocContainer';
 import { addCode, getOrCreateInteractiveWindow } from './interactiveWindowTestHelpers';
 import { addCell, createNewEditor } from './nativeEditorTestHelpers';
 import { openVariableExplorer, runDoubleTest, runInteractiveTest, waitForVariablesUpdated } from './testHelpers';
-import { verifyAfterStep, verifyCanFetchData, verifyVariables } from './variableTestHelpers';
+import { verifyAfterStep, verifyCanFetchData, verifyVariableTypes, verifyVariables } from './variableTestHelpers';
 
 /* eslint-disable @typescript-eslint/no-var-requires, @typescript-eslint/no-require-imports */
 const rangeInclusive = require('range-inclusive');
@@ -592,6 +592,25 @@ mySeries = myDataframe[0]
             }
         );
 
+        runInteractiveTest(
+            'Variable explorer - Types skip deleted variables',
+            async () => {
+                const { mount } = await getOrCreateInteractiveWindow(ioc);
+                const wrapper = mount.wrapper;
+
+                openVariableExplorer(wrapper);
+
+                await addCodeImpartial(wrapper, 'a=1\na');
+                await addCodeImpartial(wrapper, 'b=2\ndel b');
+
+                // A name that no longer exists in the kernel should be left out rather than fail the whole request
+                await verifyVariableTypes(ioc, ['a', 'b'], { a: 'int' });
+            },
+            () => {
+                return Promise.resolve(ioc);
+            }
+        );
+
         runInteractiveTest(
             '2D tensor shapes are correctly reported',
             async () => {